@@ -8,7 +8,12 @@ import os
 
 MAX_WIDTH  = 200
 MAX_HEIGHT = 100
+MAX_ROWS   = 62
 CHARS = "`'\"-~:;=+aow#W@"
+CHAR_TABLE = np.frombuffer(CHARS.encode("ascii"), dtype=np.uint8)
+DIGIT_TABLE = np.array([list(f"{i:03d}".encode("ascii")) for i in range(256)], dtype=np.uint8)
+ANSI_PREFIX = np.frombuffer(b"\033[38;2;", dtype=np.uint8)
+ANSI_CELL = 20
 
 
 def rgbToAnsi(r, g, b):
@@ -18,6 +23,89 @@ def resetColor():
     return "\033[0m"
 
 
+class AsciiFrame:
+    def __init__(self, glyphs, colors=None, _owned=False):
+        self.glyphs = self._freeze(glyphs, _owned)
+        self.colors = None if colors is None else self._freeze(colors, _owned)
+        self.rows, self.cols = self.glyphs.shape
+        self._encoded = {}
+
+    @staticmethod
+    def _freeze(array, owned):
+        if owned:
+            array = np.ascontiguousarray(array, dtype=np.uint8)
+        else:
+            array = np.array(array, dtype=np.uint8, order="C")
+        array.setflags(write=False)
+        return array
+
+    @property
+    def shape(self):
+        return self.rows, self.cols
+
+    @property
+    def glyphView(self):
+        return memoryview(self.glyphs)
+
+    @property
+    def colorView(self):
+        return None if self.colors is None else memoryview(self.colors)
+
+    def __buffer__(self, flags):
+        return memoryview(self.glyphs)
+
+    def __str__(self):
+        return self.toText()
+
+    def toBytes(self, ansi=False, cache=True):
+        ansi = ansi and self.colors is not None
+        if ansi in self._encoded:
+            return self._encoded[ansi]
+
+        data = self._encodeAnsi() if ansi else self._encodeText()
+        if cache:
+            self._encoded[ansi] = data
+        return data
+
+    def toText(self):
+        return self.toBytes().decode("ascii")
+
+    def toAnsi(self):
+        return self.toBytes(ansi=True).decode("ascii")
+
+    def _encodeText(self):
+        out = np.empty((self.rows, self.cols + 1), dtype=np.uint8)
+        out[:, :self.cols] = CHAR_TABLE[self.glyphs]
+        out[:, self.cols] = ord("\n")
+        return out.tobytes()[:-1]
+
+    def _encodeAnsi(self):
+        cells = np.empty((self.rows, self.cols, ANSI_CELL), dtype=np.uint8)
+        cells[..., 0:7] = ANSI_PREFIX
+        cells[..., 7:10] = DIGIT_TABLE[self.colors[..., 0]]
+        cells[..., 10] = ord(";")
+        cells[..., 11:14] = DIGIT_TABLE[self.colors[..., 1]]
+        cells[..., 14] = ord(";")
+        cells[..., 15:18] = DIGIT_TABLE[self.colors[..., 2]]
+        cells[..., 18] = ord("m")
+        cells[..., 19] = CHAR_TABLE[self.glyphs]
+
+        tail = np.frombuffer((resetColor() + "\n").encode("ascii"), dtype=np.uint8)
+        lineLen = self.cols * ANSI_CELL
+        out = np.empty((self.rows, lineLen + len(tail)), dtype=np.uint8)
+        out[:, :lineLen] = cells.reshape(self.rows, lineLen)
+        out[:, lineLen:] = tail
+        return out.tobytes()[:-1]
+
+
+def fitSize(width, height, maxCols, maxRows):
+    scale = min(maxCols / width, maxRows * 2 / height)
+
+    newCols = min(maxCols, int(width  * scale + 1e-9))
+    newRows = min(maxRows, int(height * scale * 0.5 + 1e-9))
+
+    return max(1, newCols), max(1, newRows)
+
 def process(image, maxWidth, maxHeight, color=True):
     if isinstance(image, np.ndarray):
         height, width = image.shape[:2]
@@ -36,6 +124,10 @@ def process(image, maxWidth, maxHeight, color=True):
     newCols = max(1, newCols)
     newRows = max(1, newRows)
 
+    contrasted, colorData = renderPixels(image, newCols, newRows, color)
+    return newCols, newRows, contrasted, colorData
+
+def renderPixels(image, newCols, newRows, color=True):
     resized = image.resize((newCols, newRows), Image.Resampling.LANCZOS)
     resizedArr = np.array(resized)
 
@@ -56,15 +148,40 @@ def process(image, maxWidth, maxHeight, color=True):
     else:
         contrasted = grayscale.astype(int)
 
-    return newCols, newRows, contrasted, colorData
+    return contrasted, colorData
+
+def glyphIndices(pixels):
+    length = len(CHARS) - 1
+    return np.clip(pixels * length // 255, 0, length).astype(np.uint8)
+
+def loadImage(source):
+    if isinstance(source, (str, os.PathLike)):
+        return Image.open(source).convert("RGB")
+
+    if isinstance(source, Image.Image):
+        if source.mode in ("RGB", "L"):
+            return source
+        return source.convert("RGB")
+
+    if isinstance(source, np.ndarray):
+        if source.ndim == 2 or (source.ndim == 3 and source.shape[2] == 3):
+            return Image.fromarray(source)
+        raise ValueError(f"Expected an HxW or HxWx3 array, got shape {source.shape}")
+
+    raise TypeError(f"Cannot convert {type(source).__name__}, expected a path, PIL image or ndarray")
+
+def convert(source, cols=MAX_WIDTH, rows=MAX_ROWS, color=True):
+    image = loadImage(source)
+    newCols, newRows = fitSize(image.size[0], image.size[1], cols, rows)
+
+    contrasted, colorData = renderPixels(image, newCols, newRows, color)
+    return AsciiFrame(glyphIndices(contrasted), colorData, _owned=True)
 
 def getAscii(imageTuple, color=True):
     pixels    = imageTuple[2]
     colorData = imageTuple[3] if len(imageTuple) > 3 else None
 
-    length = len(CHARS) - 1
-    indices = np.clip(pixels * length // 255, 0, length).astype(int)
-    asciiChars = np.array(list(CHARS))[indices]
+    asciiChars = np.array(list(CHARS))[glyphIndices(pixels)]
 
     if color and (colorData is not None):
         flatChars  = asciiChars.flatten()
@@ -94,6 +211,19 @@ def printImage(asciiData, widthChars, color=True):
 
     sys.stdout.flush()
 
+def writeBytes(data):
+    sys.stdout.flush()
+    out = getattr(sys.stdout, "buffer", None)
+    if out is None:
+        sys.stdout.write(data.decode("ascii"))
+        sys.stdout.flush()
+        return
+    out.write(data)
+    out.flush()
+
+def printFrame(frame, color=True):
+    writeBytes(frame.toBytes(color) + b"\n")
+
 def imageToAscii(path, color=True):
     print("Starting ASCII conversion for:", path)
     print(f"Color mode: {'ON' if color else 'OFF'}")
@@ -107,16 +237,12 @@ def imageToAscii(path, color=True):
         print("Error while opening image:", e)
         return
 
-    newCols, newRows, contrasted, colorData = process(image, MAX_WIDTH, MAX_HEIGHT, color)
-    asciiData = getAscii((newCols, newRows, contrasted, colorData), color)
+    frame = convert(image, MAX_WIDTH, MAX_ROWS, color)
 
-    if color and isinstance(asciiData, tuple):
-        print(f"ASCII conversion complete, total chars: {len(asciiData[0])}")
-    else:
-        print(f"ASCII conversion complete, total chars: {len(asciiData)}")
+    print(f"ASCII conversion complete, total chars: {frame.glyphs.size}")
     sys.stdout.flush()
 
-    printImage(asciiData, newCols, color)
+    printFrame(frame, color)
 
 
 def videoToAscii(path, color=True):
@@ -150,9 +276,7 @@ def videoToAscii(path, color=True):
 
         if readFrames % step == 0:
             frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            imageTuple = process(frame_rgb, MAX_WIDTH, MAX_HEIGHT, color)
-            asciiData  = getAscii(imageTuple, color)
-            frames.append((asciiData, imageTuple[0])) 
+            frames.append(convert(frame_rgb, MAX_WIDTH, MAX_ROWS, color))
 
             progress = min(readFrames / max(1, totalFrames), 1.0)
             filled   = int(progress * barLen)
@@ -171,9 +295,9 @@ def videoToAscii(path, color=True):
 
     try:
         while True:
-            for asciiData, widthChars in frames:
+            for asciiFrame in frames:
                 sys.stdout.write("\033[2J\033[H")
-                printImage(asciiData, widthChars, color)
+                writeBytes(asciiFrame.toBytes(color, cache=False) + b"\n")
                 sys.stdout.write(
                     "Progress: [{}{}] 100.0%\n".format("=" * barLen, "")
                 )
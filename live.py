@@ -3,17 +3,17 @@ import numpy as np
 import time
 import sys
 import os
-from ascii import process, getAscii, printImage
+from ascii import convert, printFrame
 import shutil
 MAX_WIDTH = 250  
-MAX_HEIGHT = 200  
+MAX_ROWS = 125  
 
 def cleanup():
     if os.path.exists("__pycache__"):
         shutil.rmtree("__pycache__")
 
 class CameraASCII:
-    def __init__(self, camera_device=0, width=160, height=80, fpslimit=15):
+    def __init__(self, camera_device=0, width=160, height=50, fpslimit=15):
         self.camera_device = camera_device
         self.max_width = width
         self.max_height = height
@@ -58,11 +58,10 @@ class CameraASCII:
                 frame = cv2.flip(frame, 1)
                 frameRGB = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
                 
-                imageTuple = process(frameRGB, self.max_width, self.max_height, color)
-                asciiData = getAscii(imageTuple, color)
+                asciiFrame = convert(frameRGB, self.max_width, self.max_height, color)
             
                 sys.stdout.write("\033[2J\033[H")
-                printImage(asciiData, imageTuple[0], color)
+                printFrame(asciiFrame, color)
                 
                 frameCount += 1
                 if frameCount % 30 == 0:  
@@ -93,11 +92,10 @@ class CameraASCII:
             print(f"Photo saved as {filename}")
             
             frameRGB = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            imageTuple = process(frameRGB, MAX_WIDTH, MAX_HEIGHT, color)
-            asciiData = getAscii(imageTuple, color)
+            asciiFrame = convert(frameRGB, MAX_WIDTH, MAX_ROWS, color)
             
             print("\nASCII Version:")
-            printImage(asciiData, imageTuple[0], color)
+            printFrame(asciiFrame, color)
         else:
             print("Error: Failed to capture photo")
             
@@ -0,0 +1,300 @@
+import cv2
+import time
+import sys
+import math
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from ascii import convert
+
+MAX_WIDTH = 250
+MAX_HEIGHT = 120
+SEPARATOR = " | "
+MAX_FAILED_READS = 20
+MAX_FAILED_CAMERA_READS = 100
+
+
+def parseSource(arg):
+    return int(arg) if arg.isdigit() else arg
+
+def terminalBudget(width=0, height=0):
+    termWidth, termHeight = shutil.get_terminal_size((MAX_WIDTH, MAX_HEIGHT + 1))
+    if width <= 0:
+        width = min(termWidth, MAX_WIDTH)
+    if height <= 0:
+        height = min(termHeight - 1, MAX_HEIGHT)
+    return max(1, width), max(1, height)
+
+def gridShape(count, cols=0):
+    if cols <= 0:
+        cols = math.ceil(math.sqrt(count))
+    rows = math.ceil(count / cols)
+    return cols, rows
+
+def tileLines(frame, tileWidth, tileHeight, color=True):
+    text = frame.toAnsi() if color else frame.toText()
+    pad = " " * (tileWidth - frame.cols)
+    lines = [line + pad for line in text.split("\n")[:tileHeight]]
+
+    blank = " " * tileWidth
+    lines.extend([blank] * (tileHeight - len(lines)))
+    return lines
+
+def errorTile(message, tileWidth, tileHeight):
+    lines = [message[:tileWidth].ljust(tileWidth)]
+    lines.extend([" " * tileWidth] * (tileHeight - 1))
+    return lines[:tileHeight]
+
+def deadTile(tile, message, tileWidth, tileHeight):
+    marked = errorTile(message, tileWidth, tileHeight)
+    if tile is None:
+        return marked
+    return marked[:1] + tile[1:]
+
+def settleTile(future, previous, tileWidth, tileHeight):
+    try:
+        return future.result()
+    except Exception as e:
+        if previous is None:
+            return errorTile(f"Error: {e}", tileWidth, tileHeight)
+        return previous
+
+def renderTile(frameRGB, tileWidth, tileHeight, color=True):
+    frame = convert(frameRGB, tileWidth, tileHeight, color)
+    return tileLines(frame, tileWidth, tileHeight, color)
+
+
+class FeedSource:
+    def __init__(self, source):
+        self.source = source
+        self.isCamera = isinstance(source, int)
+        self.cap = None
+        self.frame = None
+        self.seq = 0
+        self.lock = threading.Lock()
+        self.running = False
+        self.dead = False
+        self.delay = 0.0
+        self.thread = None
+
+    def setup(self):
+        self.cap = cv2.VideoCapture(self.source)
+        if not self.cap.isOpened():
+            print(f"Error: Could not open source {self.source}")
+            return False
+
+        if self.isCamera:
+            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
+            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+            self.cap.set(cv2.CAP_PROP_FPS, 30)
+        else:
+            fps = self.cap.get(cv2.CAP_PROP_FPS)
+            self.delay = 1.0 / (fps if fps > 0 else 30.0)
+        return True
+
+    def start(self):
+        self.running = True
+        self.thread = threading.Thread(target=self.captureLoop, daemon=True)
+        self.thread.start()
+
+    def captureLoop(self):
+        failedReads = 0
+        maxFailed = MAX_FAILED_CAMERA_READS if self.isCamera else MAX_FAILED_READS
+        try:
+            while self.running:
+                ret, frame = self.cap.read()
+                if not ret:
+                    failedReads += 1
+                    if failedReads >= maxFailed:
+                        self.dead = True
+                        break
+                    if not self.isCamera:
+                        self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                    time.sleep(0.05)
+                    continue
+                failedReads = 0
+
+                self.publish(frame)
+        finally:
+            self.cap.release()
+
+    def publish(self, frame):
+        if self.isCamera:
+            frame = cv2.flip(frame, 1)
+        frameRGB = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+
+        with self.lock:
+            self.frame = frameRGB
+            self.seq += 1
+
+        if self.delay:
+            time.sleep(self.delay)
+
+    def latest(self):
+        with self.lock:
+            return self.seq, self.frame
+
+    def stop(self):
+        self.running = False
+        if self.thread:
+            self.thread.join(timeout=1.0)
+            if self.thread.is_alive():
+                print(f"Source {self.source} still reading, it will release on exit")
+        elif self.cap:
+            self.cap.release()
+
+
+class MosaicASCII:
+    def __init__(self, sources, width=0, height=0, fpslimit=15, gridCols=0, workers=0):
+        self.feeds = [FeedSource(source) for source in sources]
+        self.width = width
+        self.height = height
+        self.fpslimit = fpslimit
+        self.gridCols = gridCols
+        self.workers = workers
+
+    def layout(self):
+        self.gridCols, self.gridRows = gridShape(len(self.feeds), self.gridCols)
+        self.width, self.height = terminalBudget(self.width, self.height)
+        sepTotal = len(SEPARATOR) * (self.gridCols - 1)
+        self.tileWidth = max(1, (self.width - sepTotal) // self.gridCols)
+        self.tileHeight = max(1, self.height // self.gridRows - 1)
+        if self.workers <= 0:
+            self.workers = len(self.feeds)
+
+    def setup(self):
+        print(f"Opening {len(self.feeds)} sources...")
+        self.feeds = [feed for feed in self.feeds if feed.setup()]
+        if not self.feeds:
+            print("Error: No sources could be opened")
+            return False
+
+        self.layout()
+        print(f"Grid: {self.gridCols}x{self.gridRows}, tile size: {self.tileWidth}x{self.tileHeight} chars")
+        return True
+
+    def composite(self, tiles):
+        blankTile = [" " * self.tileWidth] * self.tileHeight
+        out = []
+        for gridRow in range(self.gridRows):
+            rowTiles = []
+            for gridCol in range(self.gridCols):
+                idx = gridRow * self.gridCols + gridCol
+                if idx < len(tiles) and tiles[idx] is not None:
+                    rowTiles.append(tiles[idx])
+                else:
+                    rowTiles.append(blankTile)
+            for line in range(self.tileHeight):
+                out.append(SEPARATOR.join(tile[line] for tile in rowTiles))
+            out.append("")
+        return "\n".join(out)
+
+    def getFeed(self, color=True):
+        if not self.setup():
+            return
+
+        print("Starting mosaic ASCII feed...")
+        print("Press Ctrl+C to quit")
+        print(f"Color mode: {'ON' if color else 'OFF'}")
+
+        for feed in self.feeds:
+            feed.start()
+
+        count = len(self.feeds)
+        tiles = [None] * count
+        renderedSeq = [0] * count
+        pending = [None] * count
+
+        frameCount = 0
+        fpsTimer = time.time()
+        status = ""
+
+        sys.stdout.write("\033[2J")
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                while True:
+                    tickStart = time.time()
+
+                    for i, feed in enumerate(self.feeds):
+                        future = pending[i]
+                        if future is not None:
+                            if not future.done():
+                                continue
+                            pending[i] = None
+                            tiles[i] = settleTile(future, tiles[i], self.tileWidth, self.tileHeight)
+
+                        if feed.dead:
+                            tiles[i] = deadTile(tiles[i], f"No signal: {feed.source}", self.tileWidth, self.tileHeight)
+                            continue
+
+                        seq, frame = feed.latest()
+                        if frame is not None and seq != renderedSeq[i]:
+                            renderedSeq[i] = seq
+                            pending[i] = pool.submit(renderTile, frame, self.tileWidth, self.tileHeight, color)
+
+                    frameCount += 1
+                    if frameCount % 30 == 0:
+                        current_time = time.time()
+                        actualFPS = 30 / (current_time - fpsTimer)
+                        fpsTimer = current_time
+                        live = sum(1 for feed in self.feeds if not feed.dead)
+                        status = f"FPS: {actualFPS:.1f} | Frames: {frameCount} | Sources: {live}/{count}"
+
+                    sys.stdout.write("\033[H" + self.composite(tiles) + status + "\033[K\n")
+                    sys.stdout.flush()
+
+                    elapsed = time.time() - tickStart
+                    time.sleep(max(0.0, 1.0 / self.fpslimit - elapsed))
+
+        except KeyboardInterrupt:
+            print("\nStopping mosaic feed...")
+        finally:
+            self.cleanup()
+
+    def cleanup(self):
+        for feed in self.feeds:
+            feed.stop()
+        print("Mosaic resources released")
+
+
+def main():
+    sources = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    if not sources:
+        print("Usage:")
+        print("  python mosaic.py <source> [<source> ...] [--no-color] [--fps=15] [--cols=N] [--width=N] [--height=N] [--workers=N]")
+        print("\nSources:")
+        print("  N             Camera device index (e.g. 0)")
+        print("  path          Video file, looped when it ends")
+        print("\nOptions:")
+        print("  --no-color    Disable color output")
+        print("  --fps=N       Composite refresh rate (default: 15)")
+        print("  --cols=N      Grid columns (default: square-ish grid)")
+        print("  --width=N     Total mosaic width in chars (default: terminal width, max 250)")
+        print("  --height=N    Total mosaic height in lines (default: terminal height, max 120)")
+        print("  --workers=N   Conversion threads (default: one per source)")
+        sys.exit(1)
+
+    color = "--no-color" not in sys.argv
+    fpslimit = 15
+    gridCols = 0
+    width = 0
+    height = 0
+    workers = 0
+
+    for arg in sys.argv[1:]:
+        if arg.startswith("--fps="):
+            fpslimit = int(arg.split("=")[1])
+        elif arg.startswith("--cols="):
+            gridCols = int(arg.split("=")[1])
+        elif arg.startswith("--width="):
+            width = int(arg.split("=")[1])
+        elif arg.startswith("--height="):
+            height = int(arg.split("=")[1])
+        elif arg.startswith("--workers="):
+            workers = int(arg.split("=")[1])
+
+    mosaic = MosaicASCII([parseSource(arg) for arg in sources], width, height, fpslimit, gridCols, workers)
+    mosaic.getFeed(color)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+Image = pytest.importorskip("PIL.Image")
+pytest.importorskip("cv2")
+
+import ascii
+from ascii import ANSI_CELL, AsciiFrame, convert, getAscii, glyphIndices, process, resetColor
+
+
+def gradient(width=64, height=48):
+    xs = np.linspace(0, 255, width, dtype=np.uint8)
+    ys = np.linspace(0, 255, height, dtype=np.uint8)
+    frame = np.zeros((height, width, 3), dtype=np.uint8)
+    frame[..., 0] = xs[None, :]
+    frame[..., 1] = ys[:, None]
+    frame[..., 2] = 255 - xs[None, :]
+    return frame
+
+
+def test_text_matches_getAscii():
+    newCols, newRows, contrasted, colorData = process(gradient(), 40, 40, False)
+    legacy, _ = getAscii((newCols, newRows, contrasted, colorData), False)
+
+    lines = AsciiFrame(glyphIndices(contrasted)).toText().split("\n")
+    assert len(lines) == newRows
+    for r, line in enumerate(lines):
+        assert line == legacy[r * newCols:(r + 1) * newCols]
+
+
+def test_ansi_cells_are_fixed_width():
+    frame = convert(gradient(), 30, 20)
+    text = frame.toText().split("\n")
+    reset = resetColor()
+
+    for r, line in enumerate(frame.toAnsi().split("\n")):
+        assert line.endswith(reset)
+        body = line[:-len(reset)]
+        assert len(body) == frame.cols * ANSI_CELL
+        for c in range(frame.cols):
+            cell = body[c * ANSI_CELL:(c + 1) * ANSI_CELL]
+            assert cell.startswith("\033[38;2;")
+            assert cell[-2] == "m"
+            assert cell[-1] == text[r][c]
+            rgb = [int(v) for v in cell[7:-2].split(";")]
+            assert rgb == list(frame.colors[r, c])
+
+
+def test_views_are_read_only():
+    frame = convert(gradient(), 30, 20)
+    assert frame.glyphView.shape == frame.shape
+    assert frame.colorView.shape == frame.shape + (3,)
+    assert frame.glyphView.readonly
+    with pytest.raises(ValueError):
+        frame.glyphs[0, 0] = 0
+
+
+def test_convert_respects_row_budget():
+    frame = convert(gradient(64, 48), 200, 30)
+    assert frame.rows == 30
+    assert frame.cols <= 200
+
+    frame = convert(gradient(64, 48), 20, 200)
+    assert frame.cols == 20
+    assert frame.rows <= 200
+
+
+def test_convert_normalizes_images():
+    rgba = Image.fromarray(gradient()).convert("RGBA")
+    assert convert(rgba, 30, 20).colors is not None
+
+    gray = Image.fromarray(gradient()).convert("L")
+    assert convert(gray, 30, 20).colors is None
+
+    with pytest.raises(ValueError):
+        convert(np.zeros((8, 8, 4), dtype=np.uint8), 30, 20)
+
+
+def test_uncached_bytes():
+    frame = convert(gradient(), 30, 20)
+    fresh = frame.toBytes(True, cache=False)
+    assert fresh == frame.toBytes(True, cache=False)
+    assert fresh is not frame.toBytes(True, cache=False)
+
+    cached = frame.toBytes(True)
+    assert cached == fresh
+    assert cached is frame.toBytes(True)
+
+
+def test_convert_does_not_copy_buffers(monkeypatch):
+    seen = {}
+    renderPixels = ascii.renderPixels
+    glyphIndices = ascii.glyphIndices
+
+    def recordPixels(*args):
+        seen["pixels"] = renderPixels(*args)
+        return seen["pixels"]
+
+    def recordGlyphs(pixels):
+        seen["glyphs"] = glyphIndices(pixels)
+        return seen["glyphs"]
+
+    monkeypatch.setattr(ascii, "renderPixels", recordPixels)
+    monkeypatch.setattr(ascii, "glyphIndices", recordGlyphs)
+
+    frame = convert(gradient(), 30, 20)
+    assert np.shares_memory(frame.glyphs, seen["glyphs"])
+    assert np.shares_memory(frame.colors, seen["pixels"][1])
+
+
+def test_constructor_copies_caller_buffers():
+    glyphs = np.zeros((2, 3), dtype=np.uint8)
+    frame = AsciiFrame(glyphs)
+    assert not np.shares_memory(frame.glyphs, glyphs)
+    assert glyphs.flags.writeable
@@ -0,0 +1,98 @@
+import re
+from concurrent.futures import Future
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("PIL.Image")
+pytest.importorskip("cv2")
+
+import mosaic
+from ascii import AsciiFrame
+from mosaic import MosaicASCII, deadTile, errorTile, gridShape, settleTile, terminalBudget, tileLines
+
+ANSI_ESCAPE = re.compile(r"\033\[[0-9;]*m")
+
+
+def visible(line):
+    return ANSI_ESCAPE.sub("", line)
+
+
+def sampleFrame(rows=3, cols=4):
+    glyphs = np.arange(rows * cols, dtype=np.uint8).reshape(rows, cols) % 10
+    colors = np.full((rows, cols, 3), 128, dtype=np.uint8)
+    return AsciiFrame(glyphs, colors)
+
+
+@pytest.mark.parametrize("count, cols, expected", [
+    (1, 0, (1, 1)),
+    (2, 0, (2, 1)),
+    (3, 0, (2, 2)),
+    (5, 0, (3, 2)),
+    (5, 1, (1, 5)),
+    (5, 4, (4, 2)),
+])
+def test_grid_shape(count, cols, expected):
+    assert gridShape(count, cols) == expected
+
+
+def test_terminal_budget(monkeypatch):
+    monkeypatch.setattr(mosaic.shutil, "get_terminal_size", lambda fallback: (80, 24))
+    assert terminalBudget() == (80, 23)
+    assert terminalBudget(40, 10) == (40, 10)
+
+    monkeypatch.setattr(mosaic.shutil, "get_terminal_size", lambda fallback: (1000, 1000))
+    assert terminalBudget() == (mosaic.MAX_WIDTH, mosaic.MAX_HEIGHT)
+
+
+@pytest.mark.parametrize("color", [False, True])
+def test_tile_lines_are_padded(color):
+    frame = sampleFrame()
+    lines = tileLines(frame, 10, 5, color)
+    assert len(lines) == 5
+    for line in lines:
+        assert len(visible(line)) == 10
+
+
+def test_tile_lines_are_truncated():
+    lines = tileLines(sampleFrame(rows=6), 4, 2, False)
+    assert len(lines) == 2
+
+
+def test_error_and_dead_tiles():
+    assert errorTile("Error: boom", 6, 3) == ["Error:", "      ", "      "]
+
+    tile = ["aaaa", "bbbb"]
+    assert deadTile(tile, "No signal", 4, 2) == ["No s", "bbbb"]
+    assert deadTile(None, "No signal", 4, 2) == ["No s", "    "]
+
+
+@pytest.mark.parametrize("count", [1, 2, 3, 5])
+def test_composite_fits_budget(monkeypatch, count):
+    monkeypatch.setattr(mosaic.shutil, "get_terminal_size", lambda fallback: (100, 41))
+    grid = MosaicASCII(list(range(count)))
+    grid.layout()
+    width, height = terminalBudget()
+
+    tiles = [["x" * grid.tileWidth] * grid.tileHeight for _ in range(count - 1)] + [None]
+    out = grid.composite(tiles)
+
+    assert out.count("\n") == grid.gridRows * (grid.tileHeight + 1) - 1
+    lines = out.split("\n")[:-1]
+    assert len(lines) <= height
+    assert all(len(line) <= width for line in lines)
+
+
+def test_failing_future_keeps_previous_tile():
+    failed = Future()
+    failed.set_exception(RuntimeError("boom"))
+    previous = ["old "]
+    assert settleTile(failed, previous, 4, 1) is previous
+
+    failed = Future()
+    failed.set_exception(RuntimeError("boom"))
+    assert settleTile(failed, None, 12, 1) == ["Error: boom "]
+
+    done = Future()
+    done.set_result(["new "])
+    assert settleTile(done, previous, 4, 1) == ["new "]